@@ -36,6 +36,7 @@ from .tables import (
 
 PROTOCOL_VERSION = 2.0
 DEFAULT_BAUDRATE = 1_000_000
+FACTORY_BAUDRATE = 57_600
 DEFAULT_TIMEOUT_MS = 1000
 
 NORMALIZED_DATA = ["Goal_Position", "Present_Position"]
@@ -111,6 +112,7 @@ class DynamixelMotorsBus(MotorsBus):
     available_baudrates = deepcopy(AVAILABLE_BAUDRATES)
     default_baudrate = DEFAULT_BAUDRATE
     default_timeout = DEFAULT_TIMEOUT_MS
+    factory_baudrate = FACTORY_BAUDRATE
     model_baudrate_table = deepcopy(MODEL_BAUDRATE_TABLE)
     model_ctrl_table = deepcopy(MODEL_CONTROL_TABLE)
     model_encoding_table = deepcopy(MODEL_ENCODING_TABLE)
@@ -142,9 +144,7 @@ class DynamixelMotorsBus(MotorsBus):
 
     def _find_single_motor(self, motor: str, initial_baudrate: int | None = None) -> tuple[int, int]:
         model = self.motors[motor].model
-        search_baudrates = (
-            [initial_baudrate] if initial_baudrate is not None else self.model_baudrate_table[model]
-        )
+        search_baudrates = self._get_search_baudrates(model, initial_baudrate)
 
         for baudrate in search_baudrates:
             self.set_baudrate(baudrate)
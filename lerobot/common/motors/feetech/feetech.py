@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import logging
+import select
+import sys
 from copy import deepcopy
 from enum import Enum
 from pprint import pformat
@@ -21,8 +23,7 @@ from lerobot.common.utils.encoding_utils import decode_sign_magnitude, encode_si
 
 from ..motors_bus import Motor, MotorCalibration, MotorsBus, NameOrID, Value, get_address
 from .tables import (
-    FIRMWARE_MAJOR_VERSION,
-    FIRMWARE_MINOR_VERSION,
+    FIRMWARE_VERSION,
     MODEL_BAUDRATE_TABLE,
     MODEL_CONTROL_TABLE,
     MODEL_ENCODING_TABLE,
@@ -35,6 +36,7 @@ from .tables import (
 
 DEFAULT_PROTOCOL_VERSION = 0
 DEFAULT_BAUDRATE = 1_000_000
+FACTORY_BAUDRATE = 1_000_000
 DEFAULT_TIMEOUT_MS = 1000
 
 NORMALIZED_DATA = ["Goal_Position", "Present_Position"]
@@ -106,6 +108,7 @@ class FeetechMotorsBus(MotorsBus):
     available_baudrates = deepcopy(SCAN_BAUDRATES)
     default_baudrate = DEFAULT_BAUDRATE
     default_timeout = DEFAULT_TIMEOUT_MS
+    factory_baudrate = FACTORY_BAUDRATE
     model_baudrate_table = deepcopy(MODEL_BAUDRATE_TABLE)
     model_ctrl_table = deepcopy(MODEL_CONTROL_TABLE)
     model_encoding_table = deepcopy(MODEL_ENCODING_TABLE)
@@ -175,9 +178,7 @@ class FeetechMotorsBus(MotorsBus):
 
     def _find_single_motor_p0(self, motor: str, initial_baudrate: int | None = None) -> tuple[int, int]:
         model = self.motors[motor].model
-        search_baudrates = (
-            [initial_baudrate] if initial_baudrate is not None else self.model_baudrate_table[model]
-        )
+        search_baudrates = self._get_search_baudrates(model, initial_baudrate)
         expected_model_nb = self.model_number_table[model]
 
         for baudrate in search_baudrates:
@@ -199,9 +200,7 @@ class FeetechMotorsBus(MotorsBus):
         import scservo_sdk as scs
 
         model = self.motors[motor].model
-        search_baudrates = (
-            [initial_baudrate] if initial_baudrate is not None else self.model_baudrate_table[model]
-        )
+        search_baudrates = self._get_search_baudrates(model, initial_baudrate)
         expected_model_nb = self.model_number_table[model]
 
         for baudrate in search_baudrates:
@@ -359,6 +358,7 @@ class FeetechMotorsBus(MotorsBus):
 
         rxpacket = []
         while not self.port_handler.isPacketTimeout() and rx_length < wait_length:
+            self._wait_for_rx()
             rxpacket += self.port_handler.readPort(wait_length - rx_length)
             rx_length = len(rxpacket)
 
@@ -402,6 +402,15 @@ class FeetechMotorsBus(MotorsBus):
                 del rxpacket[0:idx]
                 rx_length = rx_length - idx
 
+    def _wait_for_rx(self) -> None:
+        # The SDK opens the port in non-blocking mode, so polling `readPort` until the packet deadline spins
+        # a CPU core. On POSIX, sleep in select() until bytes arrive or the deadline expires instead.
+        if sys.platform == "win32":
+            return
+        remaining_ms = self.port_handler.packet_timeout - self.port_handler.getTimeSinceStart()
+        if remaining_ms > 0:
+            select.select([self.port_handler.ser], [], [], remaining_ms / 1000)
+
     def broadcast_ping(self, num_retry: int = 0, raise_on_error: bool = False) -> dict[int, int] | None:
         self._assert_protocol_is_compatible("broadcast_ping")
         for n_try in range(1 + num_retry):
@@ -426,18 +435,12 @@ class FeetechMotorsBus(MotorsBus):
     def _read_firmware_version(self, motor_ids: list[int], raise_on_error: bool = False) -> dict[int, str]:
         firmware_versions = {}
         for id_ in motor_ids:
-            firm_ver_major, comm, error = self._read(
-                *FIRMWARE_MAJOR_VERSION, id_, raise_on_error=raise_on_error
-            )
-            if not self._is_comm_success(comm) or self._is_error(error):
-                continue
-
-            firm_ver_minor, comm, error = self._read(
-                *FIRMWARE_MINOR_VERSION, id_, raise_on_error=raise_on_error
-            )
+            # Major and minor versions are contiguous: read them in a single transaction
+            firm_ver, comm, error = self._read(*FIRMWARE_VERSION, id_, raise_on_error=raise_on_error)
             if not self._is_comm_success(comm) or self._is_error(error):
                 continue
 
+            firm_ver_major, firm_ver_minor = self._split_into_byte_chunks(firm_ver, 2)
             firmware_versions[id_] = f"{firm_ver_major}.{firm_ver_minor}"
 
         return firmware_versions
@@ -14,6 +14,7 @@
 
 FIRMWARE_MAJOR_VERSION = (0, 1)
 FIRMWARE_MINOR_VERSION = (1, 1)
+FIRMWARE_VERSION = (0, 2)  # major & minor versions read together
 MODEL_NUMBER = (3, 2)
 
 # TODO(Steven): Consider doing the following:
@@ -21,6 +21,7 @@
 
 import abc
 import logging
+import sys
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
@@ -252,6 +253,7 @@ class MotorsBus(abc.ABC):
     apply_drive_mode: bool
     available_baudrates: list[int]
     default_baudrate: int
+    factory_baudrate: int
     default_timeout: int
     model_baudrate_table: dict[str, dict]
     model_ctrl_table: dict[str, dict]
@@ -441,7 +443,8 @@ class MotorsBus(abc.ABC):
         try:
             if not self.port_handler.openPort():
                 raise OSError(f"Failed to open port '{self.port}'.")
-            elif handshake:
+            self._set_low_latency_mode()
+            if handshake:
                 self._handshake()
         except (FileNotFoundError, OSError, serial.SerialException) as e:
             raise ConnectionError(
@@ -449,6 +452,16 @@ class MotorsBus(abc.ABC):
                 "\nTry running `python lerobot/find_port.py`\n"
             ) from e
 
+    def _set_low_latency_mode(self) -> None:
+        # USB-serial adapters (e.g. FTDI) hold incoming bytes for up to 16ms by default before handing them
+        # over, which stalls every status packet. On Linux, the ASYNC_LOW_LATENCY flag removes that wait.
+        if sys.platform != "linux" or self.port_handler.ser is None:
+            return
+        try:
+            self.port_handler.ser.set_low_latency_mode(True)
+        except (AttributeError, OSError, ValueError) as e:
+            logger.debug(f"Could not enable low latency mode on port '{self.port}': {e}")
+
     @abc.abstractmethod
     def _handshake(self) -> None:
         pass
@@ -543,6 +556,21 @@ class MotorsBus(abc.ABC):
 
         self.set_baudrate(self.default_baudrate)
 
+    def _get_search_baudrates(self, model: str, initial_baudrate: int | None = None) -> list[int]:
+        if initial_baudrate is not None:
+            return [initial_baudrate]
+
+        # Factory-fresh motors answer on the factory baud-rate and motors that have already been set up answer
+        # on the default one: try these first, then the rest of the table. `scan_port` remains the exhaustive
+        # alternative.
+        model_baudrates = list(self.model_baudrate_table[model])
+        for baudrate in reversed([self.factory_baudrate, self.default_baudrate]):
+            if baudrate in model_baudrates:
+                model_baudrates.remove(baudrate)
+                model_baudrates.insert(0, baudrate)
+
+        return model_baudrates
+
     @abc.abstractmethod
     def _find_single_motor(self, motor: str, initial_baudrate: int | None) -> tuple[int, int]:
         pass
@@ -637,6 +665,9 @@ class MotorsBus(abc.ABC):
             if self.port_handler.getBaudRate() != baudrate:
                 raise RuntimeError("Failed to write bus baud rate.")
 
+            # The SDK reopens the serial port when changing baud rate
+            self._set_low_latency_mode()
+
     @property
     @abc.abstractmethod
     def is_calibrated(self) -> bool:
@@ -754,10 +785,14 @@ class MotorsBus(abc.ABC):
             maxes = {motor: max(positions[motor], max_) for motor, max_ in maxes.items()}
 
             if display_values:
-                print("\n-------------------------------------------")
-                print(f"{'NAME':<15} | {'MIN':>6} | {'POS':>6} | {'MAX':>6}")
+                # Print the table in a single write
+                lines = ["\n-------------------------------------------"]
+                lines.append(f"{'NAME':<15} | {'MIN':>6} | {'POS':>6} | {'MAX':>6}")
                 for motor in motors:
-                    print(f"{motor:<15} | {mins[motor]:>6} | {positions[motor]:>6} | {maxes[motor]:>6}")
+                    lines.append(
+                        f"{motor:<15} | {mins[motor]:>6} | {positions[motor]:>6} | {maxes[motor]:>6}"
+                    )
+                print("\n".join(lines), flush=True)
 
             if enter_pressed():
                 user_pressed_enter = True
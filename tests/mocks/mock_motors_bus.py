@@ -109,7 +109,9 @@ class MockPortHandler:
 
 class MockMotorsBus(MotorsBus):
     available_baudrates = [500_000, 1_000_000]
+    default_baudrate = 1_000_000
     default_timeout = 1000
+    factory_baudrate = 1_000_000
     model_baudrate_table = DUMMY_MODEL_BAUDRATE_TABLE
     model_ctrl_table = DUMMY_MODEL_CTRL_TABLE
     model_encoding_table = DUMMY_MODEL_ENCODING_TABLE
@@ -91,6 +91,18 @@ def test_abc_implementation(dummy_motors):
     DynamixelMotorsBus(port="/dev/dummy-port", motors=dummy_motors)
 
 
+@pytest.mark.parametrize(
+    "initial_baudrate, expected",
+    [
+        (None, [57_600, 1_000_000, 9_600, 115_200, 2_000_000, 3_000_000, 4_000_000]),
+        (57_600, [57_600]),
+    ],
+)
+def test__get_search_baudrates(initial_baudrate, expected, dummy_motors):
+    bus = DynamixelMotorsBus(port="/dev/dummy-port", motors=dummy_motors)
+    assert bus._get_search_baudrates("xl430-w250", initial_baudrate) == expected
+
+
 @pytest.mark.parametrize("id_", [1, 2, 3])
 def test_ping(id_, mock_motors, dummy_motors):
     expected_model_nb = MODEL_NUMBER_TABLE[dummy_motors[f"dummy_{id_}"].model]
@@ -1,4 +1,5 @@
 import re
+import select
 import sys
 from typing import Generator
 from unittest.mock import MagicMock, patch
@@ -7,7 +8,7 @@ import pytest
 
 from lerobot.common.motors import Motor, MotorCalibration, MotorNormMode
 from lerobot.common.motors.feetech import MODEL_NUMBER, MODEL_NUMBER_TABLE, FeetechMotorsBus
-from lerobot.common.motors.feetech.tables import STS_SMS_SERIES_CONTROL_TABLE
+from lerobot.common.motors.feetech.tables import FIRMWARE_VERSION, STS_SMS_SERIES_CONTROL_TABLE
 from lerobot.common.utils.encoding_utils import encode_sign_magnitude
 
 try:
@@ -96,6 +97,18 @@ def test_abc_implementation(dummy_motors):
     FeetechMotorsBus(port="/dev/dummy-port", motors=dummy_motors)
 
 
+@pytest.mark.parametrize(
+    "initial_baudrate, expected",
+    [
+        (None, [1_000_000, 500_000, 250_000, 128_000, 115_200, 57_600, 38_400, 19_200]),
+        (115_200, [115_200]),
+    ],
+)
+def test__get_search_baudrates(initial_baudrate, expected, dummy_motors):
+    bus = FeetechMotorsBus(port="/dev/dummy-port", motors=dummy_motors)
+    assert bus._get_search_baudrates("sts3215", initial_baudrate) == expected
+
+
 @pytest.mark.parametrize("id_", [1, 2, 3])
 def test_ping(id_, mock_motors, dummy_motors):
     expected_model_nb = MODEL_NUMBER_TABLE[dummy_motors[f"dummy_{id_}"].model]
@@ -139,6 +152,72 @@ def test_broadcast_ping(mock_motors, dummy_motors):
     assert all(mock_motors.stubs[stub].called for stub in mobel_nb_stubs)
 
 
+def test_broadcast_ping_waits_on_select(mock_motors, dummy_motors):
+    ids = [m.id for m in dummy_motors.values()]
+    mock_motors.build_broadcast_ping_stub(ids)
+    for id_ in ids:
+        mock_motors.build_read_stub(*MODEL_NUMBER, id_, MODEL_NUMBER_TABLE["sts3215"])
+    bus = FeetechMotorsBus(
+        port=mock_motors.port,
+        motors=dummy_motors,
+    )
+    bus.connect(handshake=False)
+
+    select_calls = []
+
+    def select_spy(rlist, wlist, xlist, timeout):
+        select_calls.append((rlist, timeout, bus.port_handler.packet_timeout))
+        return select.select(rlist, wlist, xlist, timeout)
+
+    with patch("lerobot.common.motors.feetech.feetech.select") as mock_select:
+        mock_select.select.side_effect = select_spy
+        bus.broadcast_ping()
+
+    assert select_calls
+    for rlist, timeout, packet_timeout in select_calls:
+        assert rlist == [bus.port_handler.ser]
+        assert 0 < timeout <= packet_timeout / 1000
+
+
+def test_broadcast_ping_no_select_on_windows(mock_motors, dummy_motors):
+    ids = [m.id for m in dummy_motors.values()]
+    mock_motors.build_broadcast_ping_stub(ids)
+    for id_ in ids:
+        mock_motors.build_read_stub(*MODEL_NUMBER, id_, MODEL_NUMBER_TABLE["sts3215"])
+    bus = FeetechMotorsBus(
+        port=mock_motors.port,
+        motors=dummy_motors,
+    )
+    bus.connect(handshake=False)
+
+    with (
+        patch("lerobot.common.motors.feetech.feetech.sys", MagicMock(platform="win32")),
+        patch("lerobot.common.motors.feetech.feetech.select") as mock_select,
+    ):
+        ids_models = bus.broadcast_ping()
+
+    assert set(ids_models) == set(ids)
+    mock_select.select.assert_not_called()
+
+
+def test__read_firmware_version(mock_motors, dummy_motors):
+    addr, length = FIRMWARE_VERSION
+    major, minor = 3, 10
+    stubs = [
+        mock_motors.build_read_stub(addr, length, m.id, major + (minor << 8)) for m in dummy_motors.values()
+    ]
+    bus = FeetechMotorsBus(
+        port=mock_motors.port,
+        motors=dummy_motors,
+    )
+    bus.connect(handshake=False)
+
+    firmware_versions = bus._read_firmware_version(bus.ids)
+
+    assert firmware_versions == dict.fromkeys(bus.ids, f"{major}.{minor}")
+    assert all(mock_motors.stubs[stub].called for stub in stubs)
+
+
 @pytest.mark.parametrize(
     "addr, length, id_, value",
     [
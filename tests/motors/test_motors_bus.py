@@ -1,5 +1,5 @@
 import re
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -340,3 +340,71 @@ def test_sync_write_by_value_dict(data_name, ids_values, dummy_motors):
     mock__encode_sign.assert_called_once_with(data_name, ids_values)
     if data_name in bus.normalized_data:
         mock__unnormalize.assert_called_once_with(ids_values)
+
+
+@pytest.mark.parametrize("platform, expected_calls", [("linux", 1), ("darwin", 0)])
+def test__set_low_latency_mode(platform, expected_calls, dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.port_handler.ser = MagicMock()
+
+    with patch("lerobot.common.motors.motors_bus.sys.platform", platform):
+        bus.connect(handshake=False)
+
+    assert bus.port_handler.ser.set_low_latency_mode.call_count == expected_calls
+
+
+def test__set_low_latency_mode_unsupported(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.port_handler.ser = MagicMock()
+    bus.port_handler.ser.set_low_latency_mode.side_effect = ValueError("Failed to update ASYNC_LOW_LATENCY")
+
+    with patch("lerobot.common.motors.motors_bus.sys.platform", "linux"):
+        bus.connect(handshake=False)
+
+    assert bus.is_connected
+
+
+@pytest.mark.parametrize("new_baudrate, expected_calls", [(500_000, 1), (1_000_000, 0)])
+def test_set_baudrate_sets_low_latency_mode(new_baudrate, expected_calls, dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.port_handler.ser = MagicMock()
+    bus.port_handler.baudrate = 1_000_000
+    with patch("lerobot.common.motors.motors_bus.sys.platform", "linux"):
+        bus.connect(handshake=False)
+
+    def reopen_port(baudrate):
+        # The SDKs reopen the serial port when changing baud rate
+        bus.port_handler.baudrate = baudrate
+        bus.port_handler.ser = MagicMock()
+
+    with (
+        patch.object(bus.port_handler, "setBaudRate", side_effect=reopen_port),
+        patch("lerobot.common.motors.motors_bus.sys.platform", "linux"),
+    ):
+        bus.port_handler.ser.reset_mock()
+        bus.set_baudrate(new_baudrate)
+
+    assert bus.get_baudrate() == new_baudrate
+    assert bus.port_handler.ser.set_low_latency_mode.call_count == expected_calls
+
+
+@pytest.mark.parametrize(
+    "factory_baudrate, default_baudrate, expected",
+    [
+        (57_600, 1_000_000, [57_600, 1_000_000, 9_600, 115_200]),
+        (1_000_000, 1_000_000, [1_000_000, 9_600, 57_600, 115_200]),
+        (250_000, 1_000_000, [1_000_000, 9_600, 57_600, 115_200]),
+    ],
+    ids=["factory & default", "factory is default", "factory not in table"],
+)
+def test__get_search_baudrates(factory_baudrate, default_baudrate, expected, dummy_motors):
+    baudrate_table = {9_600: 0, 57_600: 1, 115_200: 2, 1_000_000: 3}
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+
+    with (
+        patch.object(MockMotorsBus, "factory_baudrate", factory_baudrate),
+        patch.object(MockMotorsBus, "default_baudrate", default_baudrate),
+        patch.object(MockMotorsBus, "model_baudrate_table", {"model_2": baudrate_table}),
+    ):
+        assert bus._get_search_baudrates("model_2") == expected
+        assert bus._get_search_baudrates("model_2", initial_baudrate=115_200) == [115_200]